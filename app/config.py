@@ -2,6 +2,8 @@
 Configuration settings for the Northern Territories News backend.
 """
 
+from typing import NamedTuple
+
 from pydantic_settings import BaseSettings
 
 
@@ -42,39 +44,23 @@ class Settings(BaseSettings):
         env_prefix = "NEWS_"
 
 
+class FeedSpec(NamedTuple):
+    """An RSS feed source."""
+
+    name: str
+    url: str
+    category: str
+
+
 # RSS Feed sources configuration
 # Note: Some feeds may require updates as URLs change
 RSS_FEEDS = [
-    {
-        "name": "NHK",
-        "url": "https://www.nhk.or.jp/rss/news/cat6.xml",  # 政治
-        "category": "politics",
-    },
-    {
-        "name": "NHK",
-        "url": "https://www.nhk.or.jp/rss/news/cat1.xml",  # 社会
-        "category": "society",
-    },
-    {
-        "name": "朝日新聞",
-        "url": "https://www.asahi.com/rss/asahi/newsheadlines.rdf",
-        "category": "general",
-    },
-    {
-        "name": "毎日新聞",
-        "url": "https://mainichi.jp/rss/etc/mainichi-flash.rss",
-        "category": "general",
-    },
-    {
-        "name": "時事通信",
-        "url": "https://www.jiji.com/rss/ranking.rdf",
-        "category": "general",
-    },
-    {
-        "name": "北海道新聞",
-        "url": "https://www.hokkaido-np.co.jp/output/7/free/index.ad.xml",
-        "category": "regional",
-    },
+    FeedSpec("NHK", "https://www.nhk.or.jp/rss/news/cat6.xml", "politics"),  # 政治
+    FeedSpec("NHK", "https://www.nhk.or.jp/rss/news/cat1.xml", "society"),  # 社会
+    FeedSpec("朝日新聞", "https://www.asahi.com/rss/asahi/newsheadlines.rdf", "general"),
+    FeedSpec("毎日新聞", "https://mainichi.jp/rss/etc/mainichi-flash.rss", "general"),
+    FeedSpec("時事通信", "https://www.jiji.com/rss/ranking.rdf", "general"),
+    FeedSpec("北海道新聞", "https://www.hokkaido-np.co.jp/output/7/free/index.ad.xml", "regional"),
 ]
 
 
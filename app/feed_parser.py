@@ -0,0 +1,313 @@
+"""
+Lightweight RSS/Atom feed parser for the Northern Territories News backend.
+
+Feeds are streamed from the HTTP response into lxml's incremental parser and
+entries are extracted into plain dicts using the same keys feedparser exposes
+(title, link, published, media_content, ...), so callers can consume either
+source interchangeably.
+"""
+
+import logging
+import re
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+
+import httpx
+from lxml import etree
+
+logger = logging.getLogger(__name__)
+
+ATOM_NS = "http://www.w3.org/2005/Atom"
+RSS1_NS = "http://purl.org/rss/1.0/"
+DC_NS = "http://purl.org/dc/elements/1.1/"
+MEDIA_NS = "http://search.yahoo.com/mrss/"
+
+# Size of the response chunks fed to the incremental parser
+CHUNK_SIZE = 65536
+
+# RSS 2.0 <item>, RSS 1.0 (RDF) <item> and Atom <entry>
+ENTRY_TAGS = ("item", f"{{{RSS1_NS}}}item", f"{{{ATOM_NS}}}entry")
+
+# Child element tag -> entry key for simple text fields
+TEXT_FIELDS = {
+    "title": "title",
+    f"{{{RSS1_NS}}}title": "title",
+    f"{{{ATOM_NS}}}title": "title",
+    "link": "link",
+    f"{{{RSS1_NS}}}link": "link",
+    "pubDate": "published",
+    f"{{{DC_NS}}}date": "published",
+    f"{{{ATOM_NS}}}published": "published",
+    f"{{{ATOM_NS}}}updated": "updated",
+}
+
+# RFC 822 dates as used by RSS 2.0, e.g. "Mon, 13 Oct 2025 08:00:00 GMT"
+RFC822_DATE_RE = re.compile(
+    r"^(?:\w{3},\s*)?(?P<day>\d{1,2})\s+(?P<month>\w{3})\s+(?P<year>\d{4})\s+"
+    r"(?P<hour>\d{2}):(?P<minute>\d{2})(?::(?P<second>\d{2}))?\s*(?P<zone>[+-]\d{4}|\w+)?$"
+)
+
+# ISO 8601 dates as used by Atom and Dublin Core, e.g. "2025-10-14T10:00:00+09:00"
+ISO_DATE_RE = re.compile(
+    r"^(?P<year>\d{4})-(?P<month>\d{2})-(?P<day>\d{2})"
+    r"(?:[T ](?P<hour>\d{2}):(?P<minute>\d{2})(?::(?P<second>\d{2})(?:\.(?P<fraction>\d+))?)?)?"
+    r"\s*(?P<zone>Z|[+-]\d{2}:?\d{2})?$"
+)
+
+# XML declaration that names its own encoding, e.g. <?xml version="1.0" encoding="Shift_JIS"?>
+XML_DECL_ENCODING_RE = re.compile(rb"^\s*<\?xml[^>]*\sencoding\s*=")
+
+# Byte order marks lxml detects on its own
+BOMS = (b"\xef\xbb\xbf", b"\xff\xfe", b"\xfe\xff")
+
+MONTHS = {
+    "Jan": 1, "Feb": 2, "Mar": 3, "Apr": 4, "May": 5, "Jun": 6,
+    "Jul": 7, "Aug": 8, "Sep": 9, "Oct": 10, "Nov": 11, "Dec": 12,
+}
+
+# RFC 822 zone names -> UTC offset in minutes
+ZONE_OFFSETS = {
+    "GMT": 0, "UT": 0, "UTC": 0, "Z": 0,
+    "JST": 540,
+    "EST": -300, "EDT": -240, "CST": -360, "CDT": -300,
+    "MST": -420, "MDT": -360, "PST": -480, "PDT": -420,
+}
+
+MEDIA_CONTENT_TAG = f"{{{MEDIA_NS}}}content"
+MEDIA_THUMBNAIL_TAG = f"{{{MEDIA_NS}}}thumbnail"
+ATOM_LINK_TAG = f"{{{ATOM_NS}}}link"
+
+
+@lru_cache(maxsize=64)
+def _offset_timezone(minutes: int) -> timezone:
+    """Get a (shared) timezone for a UTC offset in minutes."""
+    return timezone.utc if minutes == 0 else timezone(timedelta(minutes=minutes))
+
+
+def _parse_offset(zone: str) -> int:
+    """Convert a "+0900" / "+09:00" style offset into minutes."""
+    sign = -1 if zone[0] == "-" else 1
+    digits = zone[1:].replace(":", "")
+    return sign * (int(digits[:2]) * 60 + int(digits[2:]))
+
+
+def parse_date(value: str) -> datetime | None:
+    """
+    Parse an RFC 822 or ISO 8601 feed date without going through a generic parser.
+
+    Args:
+        value: Date string from a feed entry
+
+    Returns:
+        Datetime converted to UTC (a string without a zone is taken as UTC), or
+        None if the string is not in one of the recognised formats
+    """
+    value = value.strip()
+
+    try:
+        match = RFC822_DATE_RE.match(value)
+        if match:
+            month = MONTHS.get(match["month"])
+            zone = match["zone"]
+            if zone is None:
+                offset = 0
+            elif zone[0] in "+-":
+                offset = _parse_offset(zone)
+            else:
+                offset = ZONE_OFFSETS.get(zone.upper())
+            if month is None or offset is None:
+                return None
+            return datetime(
+                int(match["year"]),
+                month,
+                int(match["day"]),
+                int(match["hour"]),
+                int(match["minute"]),
+                int(match["second"] or 0),
+                tzinfo=_offset_timezone(offset),
+            ).astimezone(timezone.utc)
+
+        match = ISO_DATE_RE.match(value)
+        if match:
+            zone = match["zone"]
+            offset = 0 if zone is None or zone == "Z" else _parse_offset(zone)
+            fraction = match["fraction"]
+            return datetime(
+                int(match["year"]),
+                int(match["month"]),
+                int(match["day"]),
+                int(match["hour"] or 0),
+                int(match["minute"] or 0),
+                int(match["second"] or 0),
+                int(fraction[:6].ljust(6, "0")) if fraction else 0,
+                tzinfo=_offset_timezone(offset),
+            ).astimezone(timezone.utc)
+    except ValueError:
+        # Out-of-range fields, e.g. "32 Jan"
+        return None
+
+    return None
+
+
+def _extract_entry(elem: etree._Element) -> dict:
+    """
+    Extract the fields we use from an <item>/<entry> element.
+
+    Args:
+        elem: Parsed entry element
+
+    Returns:
+        Entry dict with feedparser-compatible keys
+    """
+    entry: dict = {}
+
+    for child in elem:
+        tag = child.tag
+        if not isinstance(tag, str):
+            # Comments and processing instructions
+            continue
+
+        key = TEXT_FIELDS.get(tag)
+        if key:
+            if key not in entry:
+                entry[key] = (child.text or "").strip()
+        elif tag == MEDIA_CONTENT_TAG:
+            entry.setdefault("media_content", []).append(dict(child.attrib))
+        elif tag == MEDIA_THUMBNAIL_TAG:
+            entry.setdefault("media_thumbnail", []).append(dict(child.attrib))
+        elif tag == "enclosure":
+            entry.setdefault("enclosures", []).append(
+                {"href": child.get("url", ""), "type": child.get("type", "")}
+            )
+        elif tag == ATOM_LINK_TAG:
+            rel = child.get("rel", "alternate")
+            if rel == "alternate" and "link" not in entry:
+                entry["link"] = child.get("href", "")
+            elif rel == "enclosure":
+                entry.setdefault("enclosures", []).append(
+                    {"href": child.get("href", ""), "type": child.get("type", "")}
+                )
+
+    return entry
+
+
+def _create_parser(first_chunk: bytes, charset: str | None) -> etree.XMLPullParser:
+    """
+    Create the incremental parser, deciding the document encoding once up front.
+
+    lxml reads the encoding from a BOM or the XML declaration itself. Only when
+    the document declares neither is the charset from the Content-Type header
+    used, so feeds served as e.g. Shift_JIS without a declaration still decode.
+
+    Args:
+        first_chunk: First bytes of the response body
+        charset: Charset from the response's Content-Type header, if any
+
+    Returns:
+        XMLPullParser emitting end events for feed entries
+    """
+    if charset and not first_chunk.startswith(BOMS) and not XML_DECL_ENCODING_RE.match(first_chunk):
+        try:
+            return etree.XMLPullParser(events=("end",), tag=ENTRY_TAGS, encoding=charset)
+        except LookupError:
+            # Charset names lxml doesn't know; let it detect the encoding itself
+            logger.debug(f"Ignoring unknown charset {charset!r}")
+    return etree.XMLPullParser(events=("end",), tag=ENTRY_TAGS)
+
+
+def _drain_events(parser: etree.XMLPullParser, entries: list[dict], limit: int | None) -> bool:
+    """
+    Move completed entries from the parser into the entries list.
+
+    Args:
+        parser: Incremental parser that has been fed some data
+        entries: List the extracted entries are appended to
+        limit: Maximum number of entries to collect
+
+    Returns:
+        True once the limit has been reached
+    """
+    for _, elem in parser.read_events():
+        entries.append(_extract_entry(elem))
+
+        # Drop the parsed subtree and any preceding siblings to cap memory
+        elem.clear()
+        while elem.getprevious() is not None:
+            del elem.getparent()[0]
+
+        if limit is not None and len(entries) >= limit:
+            return True
+
+    return False
+
+
+def _parse_with_feedparser(content: bytes, headers: httpx.Headers, limit: int | None) -> list[dict]:
+    """Parse a feed with feedparser, used when lxml rejects the document."""
+    # Imported lazily: feedparser is heavy and only needed for malformed feeds
+    import feedparser
+
+    # Hand over the raw bytes and headers so feedparser detects the encoding once
+    feed = feedparser.parse(content, response_headers=dict(headers))
+
+    if feed.bozo and not feed.entries:
+        raise ValueError(f"Failed to parse feed: {feed.bozo_exception}")
+
+    return feed.entries[:limit]
+
+
+async def fetch_entries(
+    client: httpx.AsyncClient,
+    url: str,
+    limit: int | None = None,
+    timeout=httpx.USE_CLIENT_DEFAULT,
+) -> list[dict]:
+    """
+    Stream an RSS or Atom feed and parse it into a list of entry dicts.
+
+    The response body is fed to the parser chunk by chunk, so it is never decoded
+    into one string. The raw chunks are kept so that a feed lxml rejects can be
+    handed to feedparser without downloading it again.
+
+    Args:
+        client: HTTP client
+        url: Feed URL
+        limit: Maximum number of entries to return
+        timeout: Request timeout, defaults to the client's
+
+    Returns:
+        List of entry dicts
+
+    Raises:
+        httpx.HTTPError: If the request fails
+        ValueError: If the feed cannot be parsed at all
+    """
+    entries: list[dict] = []
+    chunks: list[bytes] = []
+    parser = None
+
+    async with client.stream("GET", url, timeout=timeout) as response:
+        response.raise_for_status()
+        body = response.aiter_bytes(CHUNK_SIZE)
+
+        try:
+            async for chunk in body:
+                chunks.append(chunk)
+                if parser is None:
+                    parser = _create_parser(chunk, response.charset_encoding)
+                parser.feed(chunk)
+                if _drain_events(parser, entries, limit):
+                    return entries
+
+            if parser is None:
+                raise ValueError("Failed to parse feed: empty response")
+
+            parser.close()
+            _drain_events(parser, entries, limit)
+            return entries
+
+        except etree.XMLSyntaxError as e:
+            # Read the rest of the same response and let feedparser handle it
+            logger.debug(f"lxml failed to parse {url}, falling back to feedparser: {e}")
+            async for chunk in body:
+                chunks.append(chunk)
+            return _parse_with_feedparser(b"".join(chunks), response.headers, limit)
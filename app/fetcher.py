@@ -4,52 +4,75 @@ RSS Feed fetcher for Northern Territories News.
 
 import asyncio
 import logging
+import re
 import time
 from datetime import datetime, timezone
 
-import feedparser
 import httpx
-from dateutil import parser as date_parser
 
-from app.config import RSS_FEEDS, settings
+from app.config import RSS_FEEDS, FeedSpec, settings
+from app.feed_parser import fetch_entries, parse_date
 from app.models import Article, FeedStatus, FetchResult
 
 logger = logging.getLogger(__name__)
 
+# All filter keywords as one compiled alternation, so each title is scanned once
+# (None when no keywords are configured)
+KEYWORD_RE = (
+    re.compile("|".join(re.escape(kw) for kw in settings.filter_keywords), re.IGNORECASE)
+    if settings.filter_keywords
+    else None
+)
+
+
+def create_client() -> httpx.AsyncClient:
+    """
+    Create an HTTP client for fetching the configured feeds.
+
+    HTTP/2 and a keep-alive pool let concurrent requests to the same host share
+    a connection instead of each paying for its own TCP and TLS handshake.
+
+    Returns:
+        Configured async HTTP client
+    """
+    return httpx.AsyncClient(
+        http2=True,
+        limits=httpx.Limits(
+            max_connections=32,
+            max_keepalive_connections=16,
+            keepalive_expiry=30.0,
+        ),
+        timeout=httpx.Timeout(settings.fetch_timeout, connect=5.0),
+        headers={"User-Agent": "NorthernTerritoriesNewsBot/1.0"},
+        follow_redirects=True,
+    )
+
 
 class RSSFetcher:
     """Fetches and processes RSS feeds."""
 
-    def __init__(self):
-        self.timeout = settings.fetch_timeout
-        self.keywords = [kw.lower() for kw in settings.filter_keywords]
-
-    async def fetch_feed(self, client: httpx.AsyncClient, feed_config: dict) -> tuple[list[Article], FeedStatus]:
+    async def fetch_feed(
+        self, client: httpx.AsyncClient, feed_config: FeedSpec
+    ) -> tuple[list[Article], FeedStatus]:
         """
         Fetch and parse a single RSS feed.
 
         Args:
             client: HTTP client
-            feed_config: Feed configuration dict with name, url, category
+            feed_config: Feed configuration with name, url, category
 
         Returns:
             Tuple of (list of articles, feed status)
         """
-        name = feed_config["name"]
-        url = feed_config["url"]
+        name = feed_config.name
+        url = feed_config.url
 
         try:
-            response = await client.get(url, timeout=self.timeout)
-            response.raise_for_status()
-
-            # Parse the feed
-            feed = feedparser.parse(response.text)
-
-            if feed.bozo and not feed.entries:
-                raise ValueError(f"Failed to parse feed: {feed.bozo_exception}")
+            # Stream and parse the feed
+            entries = await fetch_entries(client, url, limit=settings.max_articles_per_source)
 
             articles = []
-            for entry in feed.entries[: settings.max_articles_per_source]:
+            for entry in entries:
                 article = self._parse_entry(entry, name)
                 if article:
                     articles.append(article)
@@ -81,7 +104,7 @@ class RSSFetcher:
         Parse a feed entry into an Article.
 
         Args:
-            entry: Feed entry from feedparser
+            entry: Feed entry dict from fetch_entries
             source: News source name
 
         Returns:
@@ -94,27 +117,38 @@ class RSSFetcher:
             if not title or not link:
                 return None
 
-            # Parse publication date
+            # Only keep web links; the frontend opens them directly
+            if not link.startswith(("http://", "https://")):
+                logger.debug(f"Skipping entry with non-HTTP link: {link}")
+                return None
+
+            # Parse publication date (feedparser fallback entries are pre-parsed)
             published = None
-            for date_field in ["published_parsed", "updated_parsed", "created_parsed"]:
-                if entry.get(date_field):
-                    try:
-                        published = datetime(*entry[date_field][:6], tzinfo=timezone.utc)
-                        break
-                    except (TypeError, ValueError):
-                        continue
+            parsed = (
+                entry.get("published_parsed")
+                or entry.get("updated_parsed")
+                or entry.get("created_parsed")
+            )
+            if parsed:
+                published = datetime(*parsed[:6], tzinfo=timezone.utc)
 
             # Try string date parsing as fallback
             if not published:
-                for date_field in ["published", "updated", "created"]:
-                    if entry.get(date_field):
+                date_str = entry.get("published") or entry.get("updated") or entry.get("created")
+                if date_str:
+                    published = parse_date(date_str)
+                    if not published:
+                        # Imported lazily: only needed for unusual date formats
+                        from dateutil import parser as date_parser
+
                         try:
-                            published = date_parser.parse(entry[date_field])
+                            published = date_parser.parse(date_str)
                             if published.tzinfo is None:
                                 published = published.replace(tzinfo=timezone.utc)
-                            break
-                        except (ValueError, TypeError):
-                            continue
+                            else:
+                                published = published.astimezone(timezone.utc)
+                        except (ValueError, TypeError, OverflowError):
+                            published = None
 
             # Default to current time if no date found
             if not published:
@@ -141,13 +175,11 @@ class RSSFetcher:
         Returns:
             Filtered list of articles
         """
-        filtered = []
-        for article in articles:
-            title_lower = article.title.lower()
-            if any(keyword in title_lower for keyword in self.keywords):
-                filtered.append(article)
-
-        return filtered
+        if KEYWORD_RE is None:
+            # No keywords configured, so nothing can match
+            return []
+        search = KEYWORD_RE.search
+        return [a for a in articles if search(a.title)]
 
     def deduplicate_articles(self, articles: list[Article]) -> list[Article]:
         """
@@ -163,7 +195,7 @@ class RSSFetcher:
         unique = []
 
         for article in articles:
-            url_str = str(article.url)
+            url_str = article.url
             if url_str not in seen_urls:
                 seen_urls.add(url_str)
                 unique.append(article)
@@ -183,21 +215,54 @@ class RSSFetcher:
         """
         return sorted(articles, key=lambda a: a.published_at, reverse=descending)
 
-    async def fetch_all(self) -> FetchResult:
+    def process(self, articles: list[Article], descending: bool = True) -> list[Article]:
+        """
+        Filter, deduplicate and sort articles in a single pass.
+
+        Equivalent to filter_articles, deduplicate_articles and sort_articles
+        applied in that order, without building the intermediate lists.
+
+        Args:
+            articles: List of articles
+            descending: Sort newest first if True
+
+        Returns:
+            Filtered, deduplicated and sorted list of articles
+        """
+        if KEYWORD_RE is None:
+            # No keywords configured, so nothing can match
+            return []
+
+        search = KEYWORD_RE.search
+        seen_urls = set()
+        processed = []
+
+        for article in articles:
+            if not search(article.title):
+                continue
+
+            url_str = article.url
+            if url_str in seen_urls:
+                continue
+
+            seen_urls.add(url_str)
+            processed.append(article)
+
+        processed.sort(key=lambda a: a.published_at, reverse=descending)
+        return processed
+
+    async def fetch_all(self) -> tuple[list[Article], FetchResult]:
         """
         Fetch all configured RSS feeds and return filtered articles.
 
         Returns:
-            FetchResult with articles and status information
+            Tuple of (filtered articles, FetchResult with status information)
         """
         start_time = time.time()
         all_articles: list[Article] = []
         feed_statuses: list[FeedStatus] = []
 
-        async with httpx.AsyncClient(
-            headers={"User-Agent": "NorthernTerritoriesNewsBot/1.0"},
-            follow_redirects=True,
-        ) as client:
+        async with create_client() as client:
             # Fetch all feeds concurrently
             tasks = [self.fetch_feed(client, feed) for feed in RSS_FEEDS]
             results = await asyncio.gather(*tasks)
@@ -208,14 +273,8 @@ class RSSFetcher:
 
         total_articles = len(all_articles)
 
-        # Filter by keywords
-        filtered_articles = self.filter_articles(all_articles)
-
-        # Deduplicate
-        filtered_articles = self.deduplicate_articles(filtered_articles)
-
-        # Sort by date
-        filtered_articles = self.sort_articles(filtered_articles)
+        # Filter by keywords, deduplicate and sort by date
+        filtered_articles = self.process(all_articles)
 
         # Limit total articles
         if len(filtered_articles) > settings.max_total_articles:
@@ -227,7 +286,7 @@ class RSSFetcher:
             f"Fetch complete: {total_articles} total, {len(filtered_articles)} filtered, {duration:.2f}s"
         )
 
-        return FetchResult(
+        return filtered_articles, FetchResult(
             total_articles=total_articles,
             filtered_articles=len(filtered_articles),
             feed_statuses=feed_statuses,
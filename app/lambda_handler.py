@@ -6,16 +6,21 @@ collect articles related to Northern Territories, and upload the result to S3.
 """
 
 import asyncio
-import json
+import atexit
+import gzip
+import heapq
 import logging
 import os
 import re
 from datetime import datetime, timezone
 from email.utils import parsedate_to_datetime
+from functools import lru_cache
 from urllib.parse import urlparse, urlunparse, quote
 
-import feedparser
 import httpx
+import orjson
+
+from app.feed_parser import fetch_entries, parse_date
 
 # Configure logging
 logger = logging.getLogger()
@@ -31,6 +36,11 @@ if os.environ.get("AWS_LAMBDA_FUNCTION_NAME"):
 S3_BUCKET = os.environ.get("S3_BUCKET", "northern-territories-news-prod")
 S3_KEY = os.environ.get("S3_KEY", "data/articles.json")
 
+# Articles last read from or written to S3 by this container, with the object's
+# ETag, so warm invocations can skip re-downloading an unchanged object
+_CACHED_ARTICLES: list[dict] | None = None
+_CACHED_ETAG: str | None = None
+
 # Search keywords for Google News
 SEARCH_KEYWORDS = [
     "北方領土",
@@ -44,11 +54,72 @@ SEARCH_KEYWORDS = [
 # Maximum articles to keep
 MAX_ARTICLES = 500
 
+# Media URLs that look like images
+IMAGE_URL_RE = re.compile(r"jpe?g|png|webp|image", re.IGNORECASE)
+
+# HTTP client settings: every keyword search goes to news.google.com, so with
+# HTTP/2 they are multiplexed over a single kept-alive connection. The idle
+# expiry is longer than the schedule interval so the connection is still pooled
+# on the next warm invocation.
+HTTP_LIMITS = httpx.Limits(max_connections=8, max_keepalive_connections=1, keepalive_expiry=3600.0)
+HTTP_TIMEOUT = httpx.Timeout(30.0, connect=5.0)
+
+# Errors from a pooled connection the server closed while the container was frozen
+STALE_CONNECTION_ERRORS = (httpx.RemoteProtocolError, httpx.ReadError, httpx.WriteError)
+
+# Event loop and HTTP client kept alive across warm invocations, so pooled
+# connections (and their DNS lookups and TLS sessions) are reused between runs.
+# The client's connections belong to the loop that opened them, which is why
+# every invocation runs on the same loop instead of a fresh asyncio.run().
+_LOOP: asyncio.AbstractEventLoop | None = None
+_CLIENT: httpx.AsyncClient | None = None
+
+
+def get_client() -> httpx.AsyncClient:
+    """Get the shared HTTP client, creating it on first use."""
+    global _CLIENT
+    if _CLIENT is None:
+        _CLIENT = httpx.AsyncClient(
+            http2=True,
+            limits=HTTP_LIMITS,
+            timeout=HTTP_TIMEOUT,
+            headers={
+                "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+            },
+            follow_redirects=True,
+        )
+    return _CLIENT
+
+
+def run_async(coro):
+    """Run a coroutine to completion on the shared event loop."""
+    global _LOOP
+    if _LOOP is None or _LOOP.is_closed():
+        _LOOP = asyncio.new_event_loop()
+    return _LOOP.run_until_complete(coro)
+
 
+def _close_client() -> None:
+    """Close the shared HTTP client and event loop on interpreter shutdown."""
+    if _LOOP is None or _LOOP.is_closed():
+        return
+    if _CLIENT is not None:
+        _LOOP.run_until_complete(_CLIENT.aclose())
+    _LOOP.close()
+
+
+atexit.register(_close_client)
+
+
+@lru_cache(maxsize=4096)
 def normalize_url(url: str) -> str:
     """Normalize URL by removing query parameters for deduplication."""
     if not url:
         return url
+    # Fast path: strip query and fragment with plain string splits
+    base = url.split('?', 1)[0].split('#', 1)[0]
+    if '://' in base:
+        return base
     parsed = urlparse(url)
     return urlunparse((parsed.scheme, parsed.netloc, parsed.path, '', '', ''))
 
@@ -70,16 +141,25 @@ def extract_source_from_title(title: str) -> tuple[str, str]:
 
 
 def parse_pub_date(pub_date_str: str) -> datetime:
-    """Parse publication date from RSS feed."""
+    """
+    Parse publication date from RSS feed.
+
+    Dates are returned in UTC so the publishedAt strings sort chronologically.
+    """
+    # Fast path for well-formed RFC 822 / ISO 8601 dates
+    published = parse_date(pub_date_str)
+    if published:
+        return published
+
     try:
         # Try RFC 2822 format (standard RSS)
-        return parsedate_to_datetime(pub_date_str)
+        return _to_utc(parsedate_to_datetime(pub_date_str))
     except Exception:
         pass
 
     try:
-        # Try ISO format
-        return datetime.fromisoformat(pub_date_str.replace('Z', '+00:00'))
+        # Try ISO format (fromisoformat accepts a "Z" suffix since Python 3.11)
+        return _to_utc(datetime.fromisoformat(pub_date_str))
     except Exception:
         pass
 
@@ -87,34 +167,36 @@ def parse_pub_date(pub_date_str: str) -> datetime:
     return datetime.now(timezone.utc)
 
 
+def _to_utc(value: datetime) -> datetime:
+    """Convert a datetime to UTC, taking naive values as UTC."""
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc)
+
+
 def extract_image_url(entry) -> str | None:
     """
     Extract image URL from Google News RSS entry.
 
-    Google News RSS uses media:content for images.
+    Google News RSS uses media:content for images. Thumbnails are always
+    images, so they are checked first without inspecting the URL.
     """
-    # Try media_content (feedparser normalizes media:content)
-    media_content = entry.get("media_content", [])
-    if media_content and isinstance(media_content, list):
-        for media in media_content:
-            url = media.get("url", "")
-            if url and ("jpg" in url or "jpeg" in url or "png" in url or "webp" in url or "image" in url):
-                return url
-
     # Try media_thumbnail
-    media_thumbnail = entry.get("media_thumbnail", [])
-    if media_thumbnail and isinstance(media_thumbnail, list):
-        for thumb in media_thumbnail:
-            url = thumb.get("url", "")
-            if url:
-                return url
+    for thumb in entry.get("media_thumbnail") or ():
+        url = thumb.get("url")
+        if url:
+            return url
+
+    # Try media_content (media:content elements) that look like images
+    for media in entry.get("media_content") or ():
+        url = media.get("url")
+        if url and IMAGE_URL_RE.search(url):
+            return url
 
     # Try enclosure
-    enclosures = entry.get("enclosures", [])
-    if enclosures:
-        for enc in enclosures:
-            if enc.get("type", "").startswith("image/"):
-                return enc.get("href") or enc.get("url")
+    for enc in entry.get("enclosures") or ():
+        if enc.get("type", "").startswith("image/"):
+            return enc.get("href") or enc.get("url")
 
     return None
 
@@ -134,17 +216,19 @@ async def fetch_google_news_rss(keyword: str, client: httpx.AsyncClient) -> list
     url = f"https://news.google.com/rss/search?q={encoded_keyword}&hl=ja&gl=JP&ceid=JP:ja"
 
     try:
-        response = await client.get(url, timeout=30.0)
-        response.raise_for_status()
-
-        feed = feedparser.parse(response.text)
-
-        if feed.bozo and not feed.entries:
-            logger.warning(f"Failed to parse feed for '{keyword}': {feed.bozo_exception}")
+        try:
+            try:
+                entries = await fetch_entries(client, url)
+            except STALE_CONNECTION_ERRORS as e:
+                # Retry once; the failed connection has been dropped from the pool
+                logger.info(f"Retrying '{keyword}' after stale connection: {e!r}")
+                entries = await fetch_entries(client, url)
+        except ValueError as e:
+            logger.warning(f"Failed to parse feed for '{keyword}': {e}")
             return []
 
         articles = []
-        for entry in feed.entries:
+        for entry in entries:
             try:
                 raw_title = entry.get("title", "").strip()
                 if not raw_title:
@@ -203,22 +287,17 @@ async def fetch_all_keywords() -> dict:
         "failed_fetches": 0,
     }
 
-    async with httpx.AsyncClient(
-        headers={
-            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
-        },
-        follow_redirects=True,
-    ) as client:
-        tasks = [fetch_google_news_rss(kw, client) for kw in SEARCH_KEYWORDS]
-        results = await asyncio.gather(*tasks, return_exceptions=True)
-
-        for i, result in enumerate(results):
-            if isinstance(result, Exception):
-                logger.error(f"Error for keyword '{SEARCH_KEYWORDS[i]}': {result}")
-                stats["failed_fetches"] += 1
-            else:
-                all_articles.extend(result)
-                stats["successful_fetches"] += 1
+    client = get_client()
+    tasks = [fetch_google_news_rss(kw, client) for kw in SEARCH_KEYWORDS]
+    results = await asyncio.gather(*tasks, return_exceptions=True)
+
+    for i, result in enumerate(results):
+        if isinstance(result, Exception):
+            logger.error(f"Error for keyword '{SEARCH_KEYWORDS[i]}': {result}")
+            stats["failed_fetches"] += 1
+        else:
+            all_articles.extend(result)
+            stats["successful_fetches"] += 1
 
     stats["total_fetched"] = len(all_articles)
 
@@ -239,10 +318,26 @@ def load_existing_articles() -> list[dict]:
         logger.warning("S3 client not available, returning empty list")
         return []
 
+    global _CACHED_ARTICLES, _CACHED_ETAG
+
     try:
+        # Skip the download if the object is still the one this container last saw
+        if _CACHED_ARTICLES is not None:
+            head = s3_client.head_object(Bucket=S3_BUCKET, Key=S3_KEY)
+            if head['ETag'] == _CACHED_ETAG:
+                logger.info(f"S3 object unchanged, reusing {len(_CACHED_ARTICLES)} cached articles")
+                return _CACHED_ARTICLES
+
         response = s3_client.get_object(Bucket=S3_BUCKET, Key=S3_KEY)
-        data = json.loads(response['Body'].read().decode('utf-8'))
+        body = response['Body'].read()
+        if response.get('ContentEncoding') == 'gzip':
+            body = gzip.decompress(body)
+        data = orjson.loads(body)
         articles = data.get('articles', [])
+
+        _CACHED_ARTICLES = articles
+        _CACHED_ETAG = response['ETag']
+
         logger.info(f"Loaded {len(articles)} existing articles from S3")
         return articles
     except s3_client.exceptions.NoSuchKey:
@@ -253,6 +348,11 @@ def load_existing_articles() -> list[dict]:
         return []
 
 
+def _published_at(article: dict) -> str:
+    """Sort key: ISO publication date string."""
+    return article.get('publishedAt', '')
+
+
 def merge_articles(existing: list[dict], new_articles: list[dict]) -> list[dict]:
     """
     Merge new articles with existing ones, avoiding duplicates.
@@ -264,19 +364,13 @@ def merge_articles(existing: list[dict], new_articles: list[dict]) -> list[dict]
     Returns:
         list: Merged and deduplicated articles
     """
-    # Build set of normalized URLs from existing articles
-    seen_urls = set()
-    seen_titles = set()
+    # Track URLs and titles of existing articles
+    seen_urls = {normalize_url(article.get('url', '')) for article in existing}
+    # Also track titles to avoid duplicates with different URLs
+    seen_titles = {article.get('title', '').lower() for article in existing}
 
-    for article in existing:
-        normalized = normalize_url(article.get('url', ''))
-        seen_urls.add(normalized)
-        # Also track titles to avoid duplicates with different URLs
-        seen_titles.add(article.get('title', '').lower())
-
-    # Add new articles that don't exist
-    merged = existing.copy()
-    new_count = 0
+    # Collect new articles that don't exist
+    fresh = []
 
     for article in new_articles:
         normalized = normalize_url(article.get('url', ''))
@@ -288,21 +382,60 @@ def merge_articles(existing: list[dict], new_articles: list[dict]) -> list[dict]
 
         seen_urls.add(normalized)
         seen_titles.add(title_lower)
-        merged.append(article)
-        new_count += 1
+        fresh.append(article)
+
+    logger.info(f"Added {len(fresh)} new articles to {len(existing)} existing")
 
-    logger.info(f"Added {new_count} new articles, total: {len(merged)}")
+    # Existing articles were stored newest first, so only the new ones need sorting
+    fresh.sort(key=_published_at, reverse=True)
 
-    # Sort by date (newest first)
-    merged.sort(key=lambda x: x.get('publishedAt', ''), reverse=True)
+    # Merge the two sorted runs (newest first), up to the limit
+    merged = []
+    merged_urls = set()
 
-    # Limit to max articles
-    if len(merged) > MAX_ARTICLES:
-        merged = merged[:MAX_ARTICLES]
+    for article in heapq.merge(existing, fresh, key=_published_at, reverse=True):
+        # Drop duplicates left over within the existing articles
+        normalized = normalize_url(article.get('url', ''))
+        if normalized in merged_urls:
+            continue
+
+        merged_urls.add(normalized)
+        merged.append(article)
+        if len(merged) >= MAX_ARTICLES:
+            break
 
     return merged
 
 
+async def fetch_and_process() -> dict:
+    """
+    Load existing articles and fetch new ones concurrently, then merge them.
+
+    The S3 GET runs in a worker thread alongside the feed fetches, so its
+    latency overlaps with the network-bound RSS requests.
+
+    Returns:
+        dict: Result containing merged articles and stats
+    """
+    async with asyncio.TaskGroup() as tg:
+        existing_task = tg.create_task(asyncio.to_thread(load_existing_articles))
+        fetch_task = tg.create_task(fetch_all_keywords())
+
+    existing_articles = existing_task.result()
+    result = fetch_task.result()
+
+    merged_articles = merge_articles(existing_articles, result["articles"])
+
+    return {
+        "articles": merged_articles,
+        "stats": {
+            **result["stats"],
+            "existing_articles": len(existing_articles),
+            "merged_total": len(merged_articles),
+        },
+    }
+
+
 def upload_to_s3(data: dict) -> dict:
     """
     Upload articles data to S3.
@@ -317,17 +450,25 @@ def upload_to_s3(data: dict) -> dict:
         logger.warning("S3 client not available, skipping upload")
         return {"uploaded": False, "reason": "S3 client not available"}
 
+    global _CACHED_ARTICLES, _CACHED_ETAG
+
     try:
-        json_data = json.dumps(data, ensure_ascii=False, indent=2)
+        # Compact JSON, gzipped: consumers get it decompressed via Content-Encoding
+        body = gzip.compress(orjson.dumps(data), compresslevel=6)
 
-        s3_client.put_object(
+        response = s3_client.put_object(
             Bucket=S3_BUCKET,
             Key=S3_KEY,
-            Body=json_data.encode("utf-8"),
+            Body=body,
+            ContentEncoding="gzip",
             ContentType="application/json; charset=utf-8",
             CacheControl="max-age=300",  # 5 minutes cache
         )
 
+        # This container now holds the latest snapshot; remember it for the next run
+        _CACHED_ARTICLES = data["articles"]
+        _CACHED_ETAG = response["ETag"]
+
         logger.info(f"Uploaded to s3://{S3_BUCKET}/{S3_KEY}")
         return {"uploaded": True, "bucket": S3_BUCKET, "key": S3_KEY}
 
@@ -347,23 +488,17 @@ def handler(event, context):
     Returns:
         dict: Lambda response
     """
-    logger.info(f"Lambda invoked with event: {json.dumps(event)}")
+    logger.info(f"Lambda invoked with event: {orjson.dumps(event).decode()}")
 
     try:
-        # Load existing articles from S3
-        existing_articles = load_existing_articles()
-
-        # Fetch from Google News RSS
-        result = asyncio.run(fetch_all_keywords())
-
-        # Merge new articles with existing
-        merged_articles = merge_articles(existing_articles, result["articles"])
+        # Load existing articles from S3, fetch Google News RSS and merge them
+        result = run_async(fetch_and_process())
 
         # Build final data
         now = datetime.now(timezone.utc)
         final_data = {
             "lastUpdated": now.isoformat(),
-            "articles": merged_articles,
+            "articles": result["articles"],
         }
 
         # Upload to S3
@@ -373,16 +508,12 @@ def handler(event, context):
             "statusCode": 200,
             "body": {
                 "message": "Google News RSS fetch completed successfully",
-                "stats": {
-                    **result["stats"],
-                    "existing_articles": len(existing_articles),
-                    "merged_total": len(merged_articles),
-                },
+                "stats": result["stats"],
                 "upload": upload_result,
             },
         }
 
-        logger.info(f"Lambda completed: {result['stats']}, merged: {len(merged_articles)}")
+        logger.info(f"Lambda completed: {result['stats']}")
         return response
 
     except Exception as e:
@@ -398,5 +529,5 @@ def handler(event, context):
 
 # For local testing
 if __name__ == "__main__":
-    result = asyncio.run(fetch_all_keywords())
-    print(json.dumps(result, ensure_ascii=False, indent=2))
+    result = run_async(fetch_all_keywords())
+    print(orjson.dumps(result, option=orjson.OPT_INDENT_2).decode())
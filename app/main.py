@@ -5,13 +5,18 @@ FastAPI application for Northern Territories News backend.
 import logging
 from contextlib import asynccontextmanager
 
+import msgspec
 from fastapi import FastAPI, Query
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import Response
 
 from app.config import settings
-from app.models import ArticleResponse, FetchResult
-from app.service import get_articles, get_last_updated, get_sources, refresh_articles
+from app.service import (
+    get_articles_json,
+    get_last_updated,
+    get_sources,
+    refresh_articles,
+)
 
 # Configure logging
 logging.basicConfig(
@@ -52,7 +57,7 @@ async def root():
     return {"message": "Northern Territories News API is running"}
 
 
-@app.get("/api/articles", response_model=ArticleResponse)
+@app.get("/api/articles")
 async def list_articles(
     source: str | None = Query(None, description="Filter by source name"),
     sort: str = Query("desc", description="Sort order: 'asc' or 'desc'"),
@@ -65,24 +70,8 @@ async def list_articles(
     - **sort**: Sort by date - 'desc' (newest first) or 'asc' (oldest first)
     - **q**: Search query to filter articles by title
     """
-    response = get_articles(source=source, sort_order=sort, search_query=q)
-
-    # Convert to JSON-compatible format
-    return JSONResponse(
-        content={
-            "articles": [
-                {
-                    "title": a.title,
-                    "url": str(a.url),
-                    "source": a.source,
-                    "publishedAt": a.published_at.isoformat(),
-                }
-                for a in response.articles
-            ],
-            "lastUpdated": response.last_updated.isoformat(),
-            "totalCount": response.total_count,
-        }
-    )
+    content = get_articles_json(source=source, sort_order=sort, search_query=q)
+    return Response(content=content, media_type="application/json")
 
 
 @app.get("/api/sources")
@@ -94,13 +83,12 @@ async def list_sources():
 @app.get("/api/status")
 async def status():
     """Get API status and last update time."""
-    return {
-        "status": "ok",
-        "lastUpdated": get_last_updated().isoformat(),
-    }
+    # Encoded with msgspec so the timestamp matches the format of /api/articles
+    content = msgspec.json.encode({"status": "ok", "lastUpdated": get_last_updated()})
+    return Response(content=content, media_type="application/json")
 
 
-@app.post("/api/refresh", response_model=FetchResult)
+@app.post("/api/refresh")
 async def trigger_refresh():
     """
     Trigger a refresh of articles from RSS feeds.
@@ -109,7 +97,7 @@ async def trigger_refresh():
     filters articles related to Northern Territories, and updates the database.
     """
     result = await refresh_articles()
-    return result
+    return Response(content=msgspec.json.encode(result), media_type="application/json")
 
 
 if __name__ == "__main__":
@@ -2,36 +2,28 @@
 Data models for the Northern Territories News backend.
 """
 
-from datetime import datetime
+from datetime import datetime, timezone
 
-from pydantic import BaseModel, Field, HttpUrl
+import msgspec
 
 
-class Article(BaseModel):
+class Article(msgspec.Struct, rename="camel"):
     """Represents a news article."""
 
-    title: str = Field(..., description="Article title")
-    url: HttpUrl = Field(..., description="Article URL")
-    source: str = Field(..., description="News source name")
-    published_at: datetime = Field(..., description="Publication date/time")
-    fetched_at: datetime = Field(default_factory=datetime.now, description="When the article was fetched")
-
-    class Config:
-        json_encoders = {datetime: lambda v: v.isoformat()}
-
+    title: str
+    url: str
+    source: str
+    published_at: datetime
 
-class ArticleResponse(BaseModel):
-    """Response model for article list endpoint."""
 
-    articles: list[Article] = Field(default_factory=list, description="List of articles")
-    last_updated: datetime = Field(default_factory=datetime.now, description="Last update timestamp")
-    total_count: int = Field(0, description="Total number of articles")
+class ArticlesFile(msgspec.Struct, rename="camel"):
+    """Contents of articles.json."""
 
-    class Config:
-        json_encoders = {datetime: lambda v: v.isoformat()}
+    last_updated: datetime = msgspec.field(default_factory=lambda: datetime.now(timezone.utc))
+    articles: list[Article] = msgspec.field(default_factory=list)
 
 
-class FeedStatus(BaseModel):
+class FeedStatus(msgspec.Struct):
     """Status of a feed fetch operation."""
 
     name: str
@@ -41,7 +33,7 @@ class FeedStatus(BaseModel):
     error: str | None = None
 
 
-class FetchResult(BaseModel):
+class FetchResult(msgspec.Struct):
     """Result of fetching all feeds."""
 
     total_articles: int
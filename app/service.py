@@ -2,76 +2,168 @@
 Article service for managing news data.
 """
 
-import json
 import logging
+from array import array
+from collections.abc import Iterator
 from datetime import datetime, timezone
 from pathlib import Path
 
-from app.config import settings
+import msgspec
+
 from app.fetcher import fetcher
-from app.models import Article, ArticleResponse, FetchResult
+from app.models import Article, ArticlesFile, FetchResult
 
 logger = logging.getLogger(__name__)
 
-# In-memory storage for articles
+# In-memory storage for articles, kept sorted newest first
 _articles: list[Article] = []
 _last_updated: datetime = datetime.now(timezone.utc)
 
+# Source of each article, parallel to _articles, and the sorted unique names;
+# rebuilt with the articles
+_sources: list[str] = []
+_sources_sorted: tuple[str, ...] = ()
+
+# JSON encoding of each article, parallel to _articles; listings and the data
+# files are assembled from these fragments
+_article_json: list[bytes] = []
+
+# Serialized /api/articles payloads keyed by (source, descending); reset whenever
+# the articles change
+_response_cache: dict[tuple[str | None, bool], bytes] = {}
+
+# Title search index, parallel to _articles: lowercased titles and a trigram ->
+# sorted article indices posting list
+_lower_titles: list[str] = []
+_trigram_index: dict[str, array] = {}
+
+# Queries at least this long are answered from the trigram index
+TRIGRAM_SIZE = 3
+
+# Decodes and validates articles.json straight into structs in one pass
+_articles_file_decoder = msgspec.json.Decoder(ArticlesFile)
+
 
 def get_data_file_path() -> Path:
     """Get the path to the data file."""
     return Path(__file__).parent.parent / "data" / "articles.json"
 
 
+def _set_articles(articles: list[Article], last_updated: datetime) -> None:
+    """Replace the in-memory articles and invalidate everything derived from them."""
+    global _articles, _last_updated, _article_json, _response_cache
+    global _sources, _sources_sorted, _lower_titles, _trigram_index
+
+    # Sorting once here lets listings walk the columns in order instead of sorting.
+    # Feed dates are stored in UTC, so their ISO strings order chronologically and
+    # compare as plain strings.
+    published_iso = [a.published_at.isoformat() for a in articles]
+    order = sorted(range(len(articles)), key=published_iso.__getitem__, reverse=True)
+    _articles = [articles[i] for i in order]
+    _last_updated = last_updated
+    _sources = [a.source for a in _articles]
+    _sources_sorted = tuple(sorted(set(_sources)))
+    _article_json = [msgspec.json.encode(a) for a in _articles]
+    _response_cache = {}
+    _lower_titles, _trigram_index = _build_search_index(_articles)
+
+
+def _build_search_index(articles: list[Article]) -> tuple[list[str], dict[str, array]]:
+    """
+    Build the title search index for a list of articles.
+
+    Args:
+        articles: Articles to index
+
+    Returns:
+        Tuple of (lowercased titles, trigram index)
+    """
+    lower_titles = [a.title.lower() for a in articles]
+
+    postings: dict[str, list[int]] = {}
+    for i, title in enumerate(lower_titles):
+        for gram in {title[j:j + TRIGRAM_SIZE] for j in range(len(title) - TRIGRAM_SIZE + 1)}:
+            postings.setdefault(gram, []).append(i)
+
+    return lower_titles, {gram: array("i", ids) for gram, ids in postings.items()}
+
+
+def _search_titles(query_lower: str) -> list[int]:
+    """
+    Find the articles whose title contains the query.
+
+    Args:
+        query_lower: Lowercased search query
+
+    Returns:
+        Sorted indices into _articles
+    """
+    if len(query_lower) < TRIGRAM_SIZE:
+        return [i for i, title in enumerate(_lower_titles) if query_lower in title]
+
+    # Every trigram of the query has to occur in a matching title
+    grams = {query_lower[j:j + TRIGRAM_SIZE] for j in range(len(query_lower) - TRIGRAM_SIZE + 1)}
+    postings = []
+    for gram in grams:
+        ids = _trigram_index.get(gram)
+        if ids is None:
+            return []
+        postings.append(ids)
+    postings.sort(key=len)
+
+    candidates = set(postings[0])
+    for ids in postings[1:]:
+        candidates.intersection_update(ids)
+        if not candidates:
+            return []
+
+    # Trigrams can match out of order, so confirm the actual substring
+    return sorted(i for i in candidates if query_lower in _lower_titles[i])
+
+
 def load_articles_from_file() -> None:
     """Load articles from the JSON file if it exists."""
-    global _articles, _last_updated
-
     data_file = get_data_file_path()
     if data_file.exists():
         try:
-            with open(data_file, "r", encoding="utf-8") as f:
-                data = json.load(f)
-
-            _articles = [
-                Article(
-                    title=a["title"],
-                    url=a["url"],
-                    source=a["source"],
-                    published_at=datetime.fromisoformat(a["publishedAt"].replace("Z", "+00:00")),
-                )
-                for a in data.get("articles", [])
-            ]
-            _last_updated = datetime.fromisoformat(
-                data.get("lastUpdated", datetime.now(timezone.utc).isoformat()).replace("Z", "+00:00")
-            )
+            data = _articles_file_decoder.decode(data_file.read_bytes())
+            _set_articles(data.articles, data.last_updated)
             logger.info(f"Loaded {len(_articles)} articles from file")
         except Exception as e:
             logger.error(f"Failed to load articles from file: {e}")
-            _articles = []
-            _last_updated = datetime.now(timezone.utc)
+            _set_articles([], datetime.now(timezone.utc))
+
+
+def _articles_file_chunks() -> Iterator[bytes]:
+    """Yield the articles.json contents (see ArticlesFile) piece by piece."""
+    yield b'{"lastUpdated":'
+    yield msgspec.json.encode(_last_updated)
+    yield b',"articles":['
+    for i, fragment in enumerate(_article_json):
+        if i:
+            yield b","
+        yield fragment
+    yield b"]}"
+
+
+def _write_articles_file(path: Path) -> None:
+    """
+    Write the articles to a JSON file.
+
+    The pre-encoded article fragments are streamed into the file, so the full
+    document is never held in memory as one bytes object.
+
+    Args:
+        path: File to write
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with path.open("wb") as f:
+        f.writelines(_articles_file_chunks())
 
 
 def save_articles_to_file() -> None:
     """Save articles to the JSON file."""
-    data_file = get_data_file_path()
-    data_file.parent.mkdir(parents=True, exist_ok=True)
-
-    data = {
-        "lastUpdated": _last_updated.isoformat(),
-        "articles": [
-            {
-                "title": a.title,
-                "url": str(a.url),
-                "source": a.source,
-                "publishedAt": a.published_at.isoformat(),
-            }
-            for a in _articles
-        ],
-    }
-
-    with open(data_file, "w", encoding="utf-8") as f:
-        json.dump(data, f, ensure_ascii=False, indent=2)
+    _write_articles_file(get_data_file_path())
 
     logger.info(f"Saved {len(_articles)} articles to file")
 
@@ -81,21 +173,10 @@ def export_to_frontend() -> None:
     frontend_data_file = Path(__file__).parent.parent.parent / "frontend" / "data" / "articles.json"
     frontend_data_file.parent.mkdir(parents=True, exist_ok=True)
 
-    data = {
-        "lastUpdated": _last_updated.isoformat(),
-        "articles": [
-            {
-                "title": a.title,
-                "url": str(a.url),
-                "source": a.source,
-                "publishedAt": a.published_at.isoformat(),
-            }
-            for a in _articles
-        ],
-    }
-
-    with open(frontend_data_file, "w", encoding="utf-8") as f:
-        json.dump(data, f, ensure_ascii=False, indent=2)
+    # The exported file keeps its indented format for readable diffs; it is only
+    # written once per refresh, so re-formatting the fragments is cheap
+    data = msgspec.json.format(b"".join(_articles_file_chunks()), indent=2)
+    frontend_data_file.write_bytes(data)
 
     logger.info(f"Exported {len(_articles)} articles to frontend")
 
@@ -107,64 +188,59 @@ async def refresh_articles() -> FetchResult:
     Returns:
         FetchResult with fetch statistics
     """
-    global _articles, _last_updated
-
-    result = await fetcher.fetch_all()
+    # fetch_all already filters, deduplicates, sorts and limits the articles
+    articles, result = await fetcher.fetch_all()
 
-    # Get filtered articles from fetcher
-    all_articles: list[Article] = []
-    for status in result.feed_statuses:
-        if status.success:
-            # Re-fetch to get articles (this is a bit redundant but keeps the code clean)
-            pass
+    _set_articles(articles, datetime.now(timezone.utc))
 
-    # Actually, let's modify the fetcher to return articles
-    # For now, let's re-fetch the data
-    import asyncio
-    import httpx
+    # Save to files
+    save_articles_to_file()
+    export_to_frontend()
 
-    async with httpx.AsyncClient(
-        headers={"User-Agent": "NorthernTerritoriesNewsBot/1.0"},
-        follow_redirects=True,
-    ) as client:
-        from app.config import RSS_FEEDS
+    return result
 
-        tasks = [fetcher.fetch_feed(client, feed) for feed in RSS_FEEDS]
-        results = await asyncio.gather(*tasks)
 
-        for articles, status in results:
-            all_articles.extend(articles)
+def _select_articles(
+    source: str | None,
+    sort_order: str,
+    search_query: str | None,
+) -> list[int] | range:
+    """
+    Select the articles for a listing.
 
-    # Filter and process
-    filtered = fetcher.filter_articles(all_articles)
-    filtered = fetcher.deduplicate_articles(filtered)
-    filtered = fetcher.sort_articles(filtered)
+    Args:
+        source: Filter by source name
+        sort_order: 'asc' or 'desc' for date sorting
+        search_query: Search query for title filtering
 
-    if len(filtered) > settings.max_total_articles:
-        filtered = filtered[: settings.max_total_articles]
+    Returns:
+        Indices into _articles, in response order
+    """
+    # Filter by search query
+    indices = _search_titles(search_query.lower()) if search_query else range(len(_articles))
 
-    _articles = filtered
-    _last_updated = datetime.now(timezone.utc)
+    # Filter by source
+    if source:
+        indices = [i for i in indices if _sources[i] == source]
 
-    # Save to files
-    save_articles_to_file()
-    export_to_frontend()
+    # Articles are stored newest first, so ascending order is just the reverse
+    if sort_order != "desc":
+        indices = indices[::-1]
 
-    return FetchResult(
-        total_articles=len(all_articles),
-        filtered_articles=len(filtered),
-        feed_statuses=result.feed_statuses,
-        duration_seconds=result.duration_seconds,
-    )
+    return indices
 
 
-def get_articles(
+def get_articles_json(
     source: str | None = None,
     sort_order: str = "desc",
     search_query: str | None = None,
-) -> ArticleResponse:
+) -> bytes:
     """
-    Get articles with optional filtering.
+    Get the serialized /api/articles payload.
+
+    The payload is assembled from the pre-encoded article fragments. Listings
+    without a search query only change when the articles do, so they are cached
+    per source and sort order until the next refresh or reload.
 
     Args:
         source: Filter by source name
@@ -172,32 +248,40 @@ def get_articles(
         search_query: Search query for title filtering
 
     Returns:
-        ArticleResponse with filtered articles
+        JSON object with articles, lastUpdated and totalCount
     """
-    articles = _articles.copy()
-
-    # Filter by source
-    if source:
-        articles = [a for a in articles if a.source == source]
-
-    # Filter by search query
-    if search_query:
-        query_lower = search_query.lower()
-        articles = [a for a in articles if query_lower in a.title.lower()]
-
-    # Sort
-    articles = sorted(articles, key=lambda a: a.published_at, reverse=(sort_order == "desc"))
-
-    return ArticleResponse(
-        articles=articles,
-        last_updated=_last_updated,
-        total_count=len(articles),
-    )
+    key = (source, sort_order == "desc")
+    if not search_query:
+        payload = _response_cache.get(key)
+        if payload is not None:
+            return payload
+
+    if not source and not search_query:
+        # Unfiltered listings join the stored fragments without gathering by index
+        fragments = _article_json if sort_order == "desc" else _article_json[::-1]
+    else:
+        indices = _select_articles(source, sort_order, search_query)
+        fragments = [_article_json[i] for i in indices]
+
+    payload = b"".join((
+        b'{"articles":[',
+        b",".join(fragments),
+        b'],"lastUpdated":',
+        msgspec.json.encode(_last_updated),
+        b',"totalCount":',
+        str(len(fragments)).encode(),
+        b"}",
+    ))
+
+    # Only cache sources that exist, so arbitrary query values can't grow the cache
+    if not search_query and (source is None or fragments):
+        _response_cache[key] = payload
+    return payload
 
 
 def get_sources() -> list[str]:
     """Get unique list of sources."""
-    return sorted(set(a.source for a in _articles))
+    return list(_sources_sorted)
 
 
 def get_last_updated() -> datetime:
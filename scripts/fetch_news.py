@@ -7,7 +7,6 @@ Usage:
 """
 
 import asyncio
-import json
 import sys
 from datetime import datetime, timezone
 from pathlib import Path
@@ -16,9 +15,9 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from app.config import RSS_FEEDS, settings
-from app.fetcher import RSSFetcher
+from app.fetcher import RSSFetcher, create_client
 
-import httpx
+import orjson
 
 
 async def main():
@@ -32,12 +31,9 @@ async def main():
     all_articles = []
     feed_results = []
 
-    async with httpx.AsyncClient(
-        headers={"User-Agent": "NorthernTerritoriesNewsBot/1.0"},
-        follow_redirects=True,
-    ) as client:
+    async with create_client() as client:
         for feed_config in RSS_FEEDS:
-            print(f"Fetching: {feed_config['name']} ({feed_config['url']})...", end=" ")
+            print(f"Fetching: {feed_config.name} ({feed_config.url})...", end=" ")
             articles, status = await fetcher.fetch_feed(client, feed_config)
             all_articles.extend(articles)
             feed_results.append(status)
@@ -50,16 +46,9 @@ async def main():
     print()
     print(f"Total articles fetched: {len(all_articles)}")
 
-    # Filter by keywords
-    filtered = fetcher.filter_articles(all_articles)
-    print(f"Articles matching keywords: {len(filtered)}")
-
-    # Deduplicate
-    filtered = fetcher.deduplicate_articles(filtered)
-    print(f"After deduplication: {len(filtered)}")
-
-    # Sort by date
-    filtered = fetcher.sort_articles(filtered)
+    # Filter by keywords, deduplicate and sort by date
+    filtered = fetcher.process(all_articles)
+    print(f"Unique articles matching keywords: {len(filtered)}")
 
     # Limit
     if len(filtered) > settings.max_total_articles:
@@ -81,12 +70,13 @@ async def main():
         ],
     }
 
+    payload = orjson.dumps(data, option=orjson.OPT_INDENT_2)
+
     # Write to frontend data directory
     frontend_path = Path(__file__).parent.parent.parent / "frontend" / "data" / "articles.json"
     frontend_path.parent.mkdir(parents=True, exist_ok=True)
 
-    with open(frontend_path, "w", encoding="utf-8") as f:
-        json.dump(data, f, ensure_ascii=False, indent=2)
+    frontend_path.write_bytes(payload)
 
     print()
     print(f"✅ Written {len(filtered)} articles to {frontend_path}")
@@ -95,8 +85,7 @@ async def main():
     backend_path = Path(__file__).parent.parent / "data" / "articles.json"
     backend_path.parent.mkdir(parents=True, exist_ok=True)
 
-    with open(backend_path, "w", encoding="utf-8") as f:
-        json.dump(data, f, ensure_ascii=False, indent=2)
+    backend_path.write_bytes(payload)
 
     print(f"✅ Written {len(filtered)} articles to {backend_path}")
 
@@ -12,27 +12,57 @@ Usage:
 """
 
 import asyncio
-import json
 import re
 import sys
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from urllib.parse import unquote, urlparse, parse_qs, urlunparse
+from urllib.parse import unquote, urlparse, parse_qs
 
 import httpx
+import orjson
 
 
 def normalize_url(url: str) -> str:
     """Normalize URL by removing query parameters for deduplication."""
     if not url:
         return url
-    parsed = urlparse(url)
-    # Remove query parameters and fragment
-    return urlunparse((parsed.scheme, parsed.netloc, parsed.path, '', '', ''))
+    # Remove query parameters and fragment with plain string splits
+    return url.split('?', 1)[0].split('#', 1)[0]
 
 # Add parent directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
+# Maximum number of keyword searches (each with its own browser) run at once
+MAX_CONCURRENT_SCRAPES = 3
+
+# Google News article links; the aria-label holds "title - source - date"
+ARTICLE_LINK_SELECTOR = "a.JtKRv[aria-label]"
+
+# Returns the aria-label and href of every article link on the page
+EXTRACT_LINKS_JS = f"""() => Array.from(document.querySelectorAll('{ARTICLE_LINK_SELECTOR}'))
+    .map(a => ({{aria: a.getAttribute('aria-label'), href: a.getAttribute('href')}}))"""
+
+# True once more article links than the given count are on the page
+MORE_LINKS_JS = f"count => document.querySelectorAll('{ARTICLE_LINK_SELECTOR}').length > count"
+
+# Absolute dates: YYYY/MM/DD (or 年/月), then MM/DD with the current year assumed
+_ABS_DATE_PATTERNS = [
+    re.compile(r"(\d{4})[/年](\d{1,2})[/月](\d{1,2})"),
+    re.compile(r"(\d{1,2})[/月](\d{1,2})[日]?"),
+]
+
+# Relative dates, e.g. "3 時間前"
+_REL_DATE_PATTERNS = [
+    (re.compile(r"(\d+)\s*秒前"), lambda x: timedelta(seconds=int(x))),
+    (re.compile(r"(\d+)\s*分前"), lambda x: timedelta(minutes=int(x))),
+    (re.compile(r"(\d+)\s*時間前"), lambda x: timedelta(hours=int(x))),
+    (re.compile(r"(\d+)\s*日前"), lambda x: timedelta(days=int(x))),
+    (re.compile(r"(\d+)\s*週間前"), lambda x: timedelta(weeks=int(x))),
+    (re.compile(r"(\d+)\s*か月前"), lambda x: timedelta(days=int(x) * 30)),
+    (re.compile(r"(\d+)\s*ヶ月前"), lambda x: timedelta(days=int(x) * 30)),
+    (re.compile(r"(\d+)\s*年前"), lambda x: timedelta(days=int(x) * 365)),
+]
+
 
 def parse_relative_date(date_str: str) -> datetime:
     """
@@ -44,13 +74,8 @@ def parse_relative_date(date_str: str) -> datetime:
     date_str = date_str.strip()
 
     # Check for absolute date format (YYYY/MM/DD or similar)
-    date_patterns = [
-        (r"(\d{4})[/年](\d{1,2})[/月](\d{1,2})", "%Y-%m-%d"),
-        (r"(\d{1,2})[/月](\d{1,2})[日]?", None),  # Current year assumed
-    ]
-
-    for pattern, fmt in date_patterns:
-        match = re.search(pattern, date_str)
+    for pattern in _ABS_DATE_PATTERNS:
+        match = pattern.search(date_str)
         if match:
             groups = match.groups()
             if len(groups) == 3:
@@ -59,19 +84,8 @@ def parse_relative_date(date_str: str) -> datetime:
                 return datetime(now.year, int(groups[0]), int(groups[1]), tzinfo=timezone.utc)
 
     # Relative time patterns
-    relative_patterns = [
-        (r"(\d+)\s*秒前", lambda x: timedelta(seconds=int(x))),
-        (r"(\d+)\s*分前", lambda x: timedelta(minutes=int(x))),
-        (r"(\d+)\s*時間前", lambda x: timedelta(hours=int(x))),
-        (r"(\d+)\s*日前", lambda x: timedelta(days=int(x))),
-        (r"(\d+)\s*週間前", lambda x: timedelta(weeks=int(x))),
-        (r"(\d+)\s*か月前", lambda x: timedelta(days=int(x) * 30)),
-        (r"(\d+)\s*ヶ月前", lambda x: timedelta(days=int(x) * 30)),
-        (r"(\d+)\s*年前", lambda x: timedelta(days=int(x) * 365)),
-    ]
-
-    for pattern, delta_func in relative_patterns:
-        match = re.search(pattern, date_str)
+    for pattern, delta_func in _REL_DATE_PATTERNS:
+        match = pattern.search(date_str)
         if match:
             return now - delta_func(match.group(1))
 
@@ -146,6 +160,7 @@ async def scrape_google_news(
     Returns:
         List of article dictionaries
     """
+    from playwright.async_api import TimeoutError as PlaywrightTimeoutError
     from playwright.async_api import async_playwright
 
     articles = []
@@ -169,8 +184,13 @@ async def scrape_google_news(
         print(f"Navigating to: {search_url}")
 
         try:
-            await page.goto(search_url, wait_until="networkidle", timeout=30000)
-            await asyncio.sleep(3)  # Wait for dynamic content
+            # Google News keeps connections open, so wait for the article links
+            # rather than for the network to go idle
+            await page.goto(search_url, wait_until="domcontentloaded", timeout=15000)
+            try:
+                await page.wait_for_selector(ARTICLE_LINK_SELECTOR, timeout=10000)
+            except PlaywrightTimeoutError:
+                print("No article links found")
 
             # Debug: save screenshot
             debug_dir = Path(__file__).parent.parent / "debug"
@@ -195,16 +215,17 @@ async def scrape_google_news(
         last_count = 0
 
         while len(articles) < max_articles and scroll_count < max_scrolls:
-            # Extract articles using JtKRv links with aria-label
-            link_elements = await page.query_selector_all("a.JtKRv[aria-label]")
+            # Extract articles using JtKRv links with aria-label, reading every
+            # link's attributes in one evaluate call
+            rows = await page.evaluate(EXTRACT_LINKS_JS)
 
-            for link_el in link_elements:
+            for row in rows:
                 if len(articles) >= max_articles:
                     break
 
                 try:
                     # Extract from aria-label: "title - source - date"
-                    aria_label = await link_el.get_attribute("aria-label")
+                    aria_label = row["aria"]
                     if not aria_label:
                         continue
 
@@ -226,7 +247,7 @@ async def scrape_google_news(
                         date_str = ""
 
                     # Get href
-                    href = await link_el.get_attribute("href")
+                    href = row["href"]
                     if href and href.startswith("./"):
                         href = "https://news.google.com" + href[1:]
 
@@ -249,9 +270,12 @@ async def scrape_google_news(
 
             # Check if we got new articles
             if len(articles) == last_count:
-                # Scroll down to load more
+                # Scroll down to load more, continuing as soon as new links appear
                 await page.evaluate("window.scrollBy(0, window.innerHeight)")
-                await asyncio.sleep(1.5)
+                try:
+                    await page.wait_for_function(MORE_LINKS_JS, arg=len(rows), timeout=3000)
+                except PlaywrightTimeoutError:
+                    pass
                 scroll_count += 1
             else:
                 last_count = len(articles)
@@ -285,84 +309,73 @@ async def main():
         "歯舞群島",
     ]
 
-    all_articles = []
-    seen_urls = set()
+    # Be nice to Google: cap the number of browsers scraping at the same time
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_SCRAPES)
 
-    for keyword in keywords:
-        print(f"\n{'='*60}")
-        print(f"Searching: {keyword}")
-        print('='*60)
+    async def scrape_keyword(keyword: str) -> list[dict]:
+        async with semaphore:
+            print(f"\n{'='*60}")
+            print(f"Searching: {keyword}")
+            print('='*60)
 
-        articles = await scrape_google_news(
-            query=keyword,
-            max_articles=50,  # Per keyword
-            headless=True,
-        )
+            return await scrape_google_news(
+                query=keyword,
+                max_articles=50,  # Per keyword
+                headless=True,
+            )
 
-        # Deduplicate using normalized URLs
-        for article in articles:
-            url = article["url"]
-            normalized = normalize_url(url)
-            if normalized not in seen_urls:
-                seen_urls.add(normalized)
-                all_articles.append(article)
+    # Results come back in keyword order, so earlier keywords still win duplicates
+    results = await asyncio.gather(*(scrape_keyword(keyword) for keyword in keywords))
 
-        # Be nice to Google
-        await asyncio.sleep(2)
+    all_articles = []
+    for articles in results:
+        # Normalize once; the URL is only needed again for deduplication
+        for article in articles:
+            article["_norm"] = normalize_url(article["url"])
+        all_articles.extend(articles)
 
     print(f"\n{'='*60}")
-    print(f"Total unique articles: {len(all_articles)}")
+    print(f"Total scraped articles: {len(all_articles)}")
     print('='*60)
 
-    # Sort by date (newest first)
-    all_articles.sort(
-        key=lambda x: x.get("publishedAt", ""),
-        reverse=True
-    )
-
     # Load existing articles
     frontend_path = Path(__file__).parent.parent.parent / "frontend" / "data" / "articles.json"
     existing_articles = []
-    existing_urls = set()
 
     if frontend_path.exists():
-        with open(frontend_path, "r", encoding="utf-8") as f:
-            data = json.load(f)
-            existing_articles = data.get("articles", [])
-            existing_urls = {normalize_url(a["url"]) for a in existing_articles}
+        data = orjson.loads(frontend_path.read_bytes())
+        existing_articles = data.get("articles", [])
         print(f"Existing articles: {len(existing_articles)}")
 
-    # Merge with existing (avoid duplicates)
+    # Merge with existing in a single pass, dropping duplicates by normalized URL
+    # (existing articles win, then the first keyword that found an article)
+    seen = set()
+    merged = []
+    for article in existing_articles:
+        normalized = normalize_url(article["url"])
+        if normalized not in seen:
+            seen.add(normalized)
+            merged.append(article)
+
+    if len(merged) < len(existing_articles):
+        print(f"Removed {len(existing_articles) - len(merged)} duplicate articles")
+
     new_count = 0
     for article in all_articles:
-        # Clean up article (remove dateStr)
-        clean_article = {
+        if article["_norm"] in seen:
+            continue
+        seen.add(article["_norm"])
+        # Clean up article (remove dateStr and _norm)
+        merged.append({
             "title": article["title"],
             "url": article["url"],
             "source": article["source"],
             "publishedAt": article["publishedAt"],
-        }
-
-        normalized = normalize_url(article["url"])
-        if normalized not in existing_urls:
-            existing_articles.append(clean_article)
-            existing_urls.add(normalized)
-            new_count += 1
+        })
+        new_count += 1
 
     print(f"New articles added: {new_count}")
-
-    # Remove duplicates from existing articles (cleanup)
-    seen_normalized = set()
-    deduplicated_articles = []
-    for article in existing_articles:
-        normalized = normalize_url(article["url"])
-        if normalized not in seen_normalized:
-            seen_normalized.add(normalized)
-            deduplicated_articles.append(article)
-
-    if len(deduplicated_articles) < len(existing_articles):
-        print(f"Removed {len(existing_articles) - len(deduplicated_articles)} duplicate articles")
-    existing_articles = deduplicated_articles
+    existing_articles = merged
 
     # Sort all by date
     existing_articles.sort(
@@ -376,17 +389,17 @@ async def main():
         "articles": existing_articles,
     }
 
+    payload = orjson.dumps(output_data, option=orjson.OPT_INDENT_2)
+
     # Save to frontend
     frontend_path.parent.mkdir(parents=True, exist_ok=True)
-    with open(frontend_path, "w", encoding="utf-8") as f:
-        json.dump(output_data, f, ensure_ascii=False, indent=2)
+    frontend_path.write_bytes(payload)
     print(f"\n✅ Saved {len(existing_articles)} articles to {frontend_path}")
 
     # Also save to backend
     backend_path = Path(__file__).parent.parent / "data" / "articles.json"
     backend_path.parent.mkdir(parents=True, exist_ok=True)
-    with open(backend_path, "w", encoding="utf-8") as f:
-        json.dump(output_data, f, ensure_ascii=False, indent=2)
+    backend_path.write_bytes(payload)
     print(f"✅ Saved {len(existing_articles)} articles to {backend_path}")
 
     # Show sample
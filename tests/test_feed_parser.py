@@ -0,0 +1,245 @@
+"""
+Tests for the streaming feed parser.
+"""
+
+from datetime import datetime, timezone
+
+import httpx
+import pytest
+
+from app.feed_parser import CHUNK_SIZE, fetch_entries, parse_date
+
+RSS2_FEED = """<?xml version="1.0" encoding="UTF-8"?>
+<rss version="2.0" xmlns:media="http://search.yahoo.com/mrss/">
+<channel>
+<title>NHK</title>
+<item>
+<title>北方領土 ニュース</title>
+<link>https://example.com/rss/1</link>
+<pubDate>Tue, 14 Oct 2025 10:00:00 +0900</pubDate>
+<media:content url="https://example.com/1.jpg" medium="image"/>
+<media:thumbnail url="https://example.com/1_thumb.jpg"/>
+<enclosure url="https://example.com/1.png" type="image/png"/>
+</item>
+<item>
+<title><![CDATA[択捉島の話]]></title>
+<link>https://example.com/rss/2</link>
+</item>
+</channel>
+</rss>
+""".encode()
+
+RDF_FEED = """<?xml version="1.0" encoding="UTF-8"?>
+<rdf:RDF xmlns:rdf="http://www.w3.org/1999/02/22-rdf-syntax-ns#"
+         xmlns="http://purl.org/rss/1.0/"
+         xmlns:dc="http://purl.org/dc/elements/1.1/">
+<channel rdf:about="https://example.com/"><title>Asahi</title></channel>
+<item rdf:about="https://example.com/rdf/1">
+<title>日露交渉</title>
+<link>https://example.com/rdf/1</link>
+<dc:date>2025-10-14T10:00:00+09:00</dc:date>
+</item>
+</rdf:RDF>
+""".encode()
+
+ATOM_FEED = """<?xml version="1.0" encoding="utf-8"?>
+<feed xmlns="http://www.w3.org/2005/Atom">
+<title>Atom</title>
+<entry>
+<title>国後島</title>
+<link rel="enclosure" href="https://example.com/atom/1.jpg" type="image/jpeg"/>
+<link rel="alternate" href="https://example.com/atom/1"/>
+<link rel="alternate" href="https://example.com/atom/1-duplicate"/>
+<published>2025-10-14T01:00:00Z</published>
+<updated>2025-10-15T01:00:00Z</updated>
+</entry>
+</feed>
+""".encode()
+
+# Unescaped "&" makes this invalid XML, which feedparser still accepts
+MALFORMED_FEED = """<rss><channel><item>
+<title>AT&T 北方領土</title>
+<link>https://example.com/bad/1</link>
+<pubDate>Mon, 13 Oct 2025 08:00:00 GMT</pubDate>
+</item></channel></rss>
+""".encode()
+
+# No XML declaration, so the encoding comes from the Content-Type header only
+SJIS_FEED = """<rss version="2.0"><channel><item>
+<title>北方領土返還</title><link>https://example.com/sjis/1</link>
+</item></channel></rss>""".encode("shift_jis")
+
+
+def make_client(body: bytes, content_type: str = "application/rss+xml") -> httpx.AsyncClient:
+    """Create a client that answers every request with the given body."""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, content=body, headers={"Content-Type": content_type})
+
+    return httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+
+async def fetch(body: bytes, content_type: str = "application/rss+xml", **kwargs) -> list[dict]:
+    async with make_client(body, content_type) as client:
+        return await fetch_entries(client, "https://example.com/feed", **kwargs)
+
+
+async def test_rss2_entries():
+    entries = await fetch(RSS2_FEED)
+
+    assert len(entries) == 2
+    first, second = entries
+    assert first["title"] == "北方領土 ニュース"
+    assert first["link"] == "https://example.com/rss/1"
+    assert first["published"] == "Tue, 14 Oct 2025 10:00:00 +0900"
+    assert first["media_content"] == [{"url": "https://example.com/1.jpg", "medium": "image"}]
+    assert first["media_thumbnail"] == [{"url": "https://example.com/1_thumb.jpg"}]
+    assert first["enclosures"] == [{"href": "https://example.com/1.png", "type": "image/png"}]
+    assert second == {"title": "択捉島の話", "link": "https://example.com/rss/2"}
+
+
+async def test_rdf_entries():
+    entries = await fetch(RDF_FEED)
+
+    assert entries == [
+        {
+            "title": "日露交渉",
+            "link": "https://example.com/rdf/1",
+            "published": "2025-10-14T10:00:00+09:00",
+        }
+    ]
+
+
+async def test_atom_entries():
+    entries = await fetch(ATOM_FEED, content_type="application/atom+xml")
+
+    assert entries == [
+        {
+            "title": "国後島",
+            "enclosures": [{"href": "https://example.com/atom/1.jpg", "type": "image/jpeg"}],
+            "link": "https://example.com/atom/1",
+            "published": "2025-10-14T01:00:00Z",
+            "updated": "2025-10-15T01:00:00Z",
+        }
+    ]
+
+
+async def test_limit():
+    entries = await fetch(RSS2_FEED, limit=1)
+
+    assert [e["link"] for e in entries] == ["https://example.com/rss/1"]
+
+
+async def test_charset_from_content_type():
+    entries = await fetch(SJIS_FEED, content_type="application/rss+xml; charset=Shift_JIS")
+
+    assert entries[0]["title"] == "北方領土返還"
+
+
+async def test_unknown_charset_is_ignored():
+    body = RSS2_FEED.split(b"?>", 1)[1]
+    entries = await fetch(body, content_type="application/rss+xml; charset=x-bogus")
+
+    assert [e["title"] for e in entries] == ["北方領土 ニュース", "択捉島の話"]
+
+
+async def test_malformed_feed_falls_back_to_feedparser():
+    entries = await fetch(MALFORMED_FEED)
+
+    assert len(entries) == 1
+    assert "北方領土" in entries[0]["title"]
+    assert entries[0]["link"] == "https://example.com/bad/1"
+    # feedparser entries come with pre-parsed dates
+    assert tuple(entries[0]["published_parsed"][:6]) == (2025, 10, 13, 8, 0, 0)
+
+
+async def test_fallback_reuses_the_streamed_body():
+    # The syntax error is in the first chunk; the remaining items follow in later ones
+    items = "".join(
+        f"<item><title>択捉島 {i}</title><link>https://example.com/big/{i}</link></item>"
+        for i in range(2000)
+    )
+    body = f"<rss><channel><item><title>AT&T</title></item>{items}</channel></rss>".encode()
+    assert len(body) > 2 * CHUNK_SIZE
+    requests = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return httpx.Response(200, content=body, headers={"Content-Type": "application/rss+xml"})
+
+    async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+        entries = await fetch_entries(client, "https://example.com/feed")
+
+    assert len(requests) == 1
+    assert len(entries) == 2001
+    assert entries[-1]["link"] == "https://example.com/big/1999"
+
+
+async def test_unparseable_feed_raises():
+    with pytest.raises(ValueError):
+        await fetch(b"\x00\x01 not a feed")
+
+
+async def test_empty_response_raises():
+    with pytest.raises(ValueError):
+        await fetch(b"")
+
+
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [
+        ("Mon, 13 Oct 2025 08:00:00 GMT", datetime(2025, 10, 13, 8, 0, tzinfo=timezone.utc)),
+        ("Tue, 14 Oct 2025 10:00:00 +0900", datetime(2025, 10, 14, 1, 0, tzinfo=timezone.utc)),
+        ("14 Oct 2025 10:00 JST", datetime(2025, 10, 14, 1, 0, tzinfo=timezone.utc)),
+        ("Mon, 13 Oct 2025 08:00:00 EST", datetime(2025, 10, 13, 13, 0, tzinfo=timezone.utc)),
+        ("Mon, 13 Oct 2025 08:00:00", datetime(2025, 10, 13, 8, 0, tzinfo=timezone.utc)),
+        ("  Mon, 13 Oct 2025 08:00:00 GMT  ", datetime(2025, 10, 13, 8, 0, tzinfo=timezone.utc)),
+    ],
+)
+def test_parse_date_rfc822(value, expected):
+    result = parse_date(value)
+
+    assert result == expected
+    assert result.utcoffset().total_seconds() == 0
+
+
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [
+        ("2025-10-14T01:00:00Z", datetime(2025, 10, 14, 1, 0, tzinfo=timezone.utc)),
+        ("2025-10-14T10:00:00+09:00", datetime(2025, 10, 14, 1, 0, tzinfo=timezone.utc)),
+        ("2025-10-14T10:00:00+0900", datetime(2025, 10, 14, 1, 0, tzinfo=timezone.utc)),
+        ("2025-10-13T20:00:00-05:00", datetime(2025, 10, 14, 1, 0, tzinfo=timezone.utc)),
+        (
+            "2025-10-14T01:00:00.123456789Z",
+            datetime(2025, 10, 14, 1, 0, 0, 123456, tzinfo=timezone.utc),
+        ),
+        ("2025-10-14 01:00", datetime(2025, 10, 14, 1, 0, tzinfo=timezone.utc)),
+        ("2025-10-14", datetime(2025, 10, 14, tzinfo=timezone.utc)),
+    ],
+)
+def test_parse_date_iso(value, expected):
+    result = parse_date(value)
+
+    assert result == expected
+    assert result.utcoffset().total_seconds() == 0
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        # Unknown zone name and month
+        "Mon, 13 Oct 2025 08:00:00 XYZ",
+        "Mon, 13 Foo 2025 08:00:00 GMT",
+        # Out-of-range fields
+        "Mon, 32 Oct 2025 08:00:00 GMT",
+        "Mon, 13 Oct 2025 25:00:00 GMT",
+        "2025-13-01T00:00:00Z",
+        "2025-02-30",
+        # Not a date at all
+        "",
+        "yesterday",
+    ],
+)
+def test_parse_date_rejects(value):
+    assert parse_date(value) is None